@@ -0,0 +1,38 @@
+"""server-side-timestamp-defaults
+
+Revision ID: 3b1f9a0c5d21
+Revises: 07feeec82aed
+Create Date: 2026-08-29 10:12:44.102938
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f9a0c5d21'
+down_revision: str | Sequence[str] | None = '07feeec82aed'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Timestamps on users/tenants/roles are now filled by Postgres instead
+    # of a Python-side default, so the columns need a DB default.
+    op.alter_column('users', 'created_at', server_default=sa.func.now())
+    op.alter_column('users', 'updated_at', server_default=sa.func.now())
+    op.alter_column('tenants', 'created_at', server_default=sa.func.now())
+    op.alter_column('tenants', 'updated_at', server_default=sa.func.now())
+    op.alter_column('roles', 'created_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('roles', 'created_at', server_default=None)
+    op.alter_column('tenants', 'updated_at', server_default=None)
+    op.alter_column('tenants', 'created_at', server_default=None)
+    op.alter_column('users', 'updated_at', server_default=None)
+    op.alter_column('users', 'created_at', server_default=None)
@@ -0,0 +1,35 @@
+"""introspect-and-oauth-lookup-indexes
+
+Revision ID: 8c4e2d7f1a90
+Revises: 3b1f9a0c5d21
+Create Date: 2026-08-29 10:41:17.555204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2d7f1a90'
+down_revision: str | Sequence[str] | None = '3b1f9a0c5d21'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_service_api_keys_active_hash',
+        'service_api_keys',
+        ['key_hash'],
+        postgresql_where=sa.text('is_active = true'),
+    )
+    op.create_index('ix_oauth_user_provider', 'oauth_accounts', ['user_id', 'provider'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_oauth_user_provider', table_name='oauth_accounts')
+    op.drop_index('ix_service_api_keys_active_hash', table_name='service_api_keys')
@@ -0,0 +1,34 @@
+"""oauth-tokens-to-text
+
+Revision ID: d57a3e9b2c48
+Revises: 8c4e2d7f1a90
+Create Date: 2026-08-29 11:03:29.884716
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd57a3e9b2c48'
+down_revision: str | Sequence[str] | None = '8c4e2d7f1a90'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('oauth_accounts', 'access_token', type_=sa.Text(),
+                    existing_type=sa.String(length=2048), existing_nullable=True)
+    op.alter_column('oauth_accounts', 'refresh_token', type_=sa.Text(),
+                    existing_type=sa.String(length=2048), existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('oauth_accounts', 'refresh_token', type_=sa.String(length=2048),
+                    existing_type=sa.Text(), existing_nullable=True)
+    op.alter_column('oauth_accounts', 'access_token', type_=sa.String(length=2048),
+                    existing_type=sa.Text(), existing_nullable=True)
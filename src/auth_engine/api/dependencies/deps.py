@@ -16,15 +16,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def get_mongodb() -> AsyncIOMotorDatabase:
-    if mongodb.mongo_db is None:
-        raise RuntimeError("MongoDB is not initialized")
-    return mongodb.mongo_db
+    return mongodb.get_mongo_db()
 
 
 async def get_audit_service() -> AuditService:
-    if mongodb.mongo_db is None:
-        raise RuntimeError("MongoDB is not initialized")
-    return AuditService(mongodb.mongo_db)
+    return AuditService(mongodb.get_mongo_db())
 
 
 async def get_redis() -> Redis:
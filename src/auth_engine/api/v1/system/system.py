@@ -1,7 +1,9 @@
+from typing import Any
+
 from fastapi import APIRouter
 
 from auth_engine.core.config import settings
-from auth_engine.core.health import check_mongodb, check_postgres, check_redis
+from auth_engine.core.health import check_all
 
 router = APIRouter()
 
@@ -17,11 +19,7 @@ async def root() -> dict[str, str]:
 
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
-    try:
-        await check_postgres()
-        await check_mongodb()
-        await check_redis()
-        return {"status": "healthy"}
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
+async def health_check() -> dict[str, Any]:
+    checks = await check_all()
+    status = "healthy" if all(checks.values()) else "unhealthy"
+    return {"status": status, "checks": checks}
@@ -11,6 +11,7 @@ from auth_engine.api.dependencies.rbac import require_permission
 from auth_engine.core.security import SecurityUtils
 from auth_engine.external_services.email.base import EmailProviderConfig
 from auth_engine.external_services.email.factory import EmailServiceFactory
+from auth_engine.external_services.email.resolver import invalidate_email_provider_cache
 from auth_engine.models import UserORM
 from auth_engine.models.email_config import EmailProviderType as ModelEmailProviderType
 from auth_engine.models.email_config import TenantEmailConfigORM
@@ -112,6 +113,7 @@ async def create_email_config(
         await deactivate_other_email_configs(db, tenant_id, keep_id=row.id)
     await db.commit()
     await db.refresh(row)
+    invalidate_email_provider_cache(tenant_id)
     return _to_response(row)
 
 
@@ -146,6 +148,7 @@ async def update_email_config(
 
     await db.commit()
     await db.refresh(row)
+    invalidate_email_provider_cache(tenant_id)
     return _to_response(row)
 
 
@@ -166,6 +169,7 @@ async def delete_email_config(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Email config not found.")
     await db.delete(row)
     await db.commit()
+    invalidate_email_provider_cache(tenant_id)
 
 
 @router.post(
@@ -11,6 +11,7 @@ from auth_engine.api.dependencies.rbac import require_permission
 from auth_engine.core.security import SecurityUtils
 from auth_engine.external_services.sms.base import SMSProviderConfig
 from auth_engine.external_services.sms.factory import SMSServiceFactory
+from auth_engine.external_services.sms.resolver import invalidate_sms_provider_cache
 from auth_engine.models import UserORM
 from auth_engine.models.sms_config import SMSProviderType as ModelSMSProviderType
 from auth_engine.models.sms_config import TenantSMSConfigORM
@@ -114,6 +115,7 @@ async def create_sms_config(
         await deactivate_other_sms_configs(db, tenant_id, keep_id=row.id)
     await db.commit()
     await db.refresh(row)
+    invalidate_sms_provider_cache(tenant_id)
     return _to_response(row)
 
 
@@ -150,6 +152,7 @@ async def update_sms_config(
 
     await db.commit()
     await db.refresh(row)
+    invalidate_sms_provider_cache(tenant_id)
     return _to_response(row)
 
 
@@ -170,6 +173,7 @@ async def delete_sms_config(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SMS config not found.")
     await db.delete(row)
     await db.commit()
+    invalidate_sms_provider_cache(tenant_id)
 
 
 @router.post(
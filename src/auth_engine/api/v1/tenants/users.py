@@ -1,7 +1,7 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth_engine.api.dependencies.deps import get_audit_service, get_db
@@ -9,7 +9,7 @@ from auth_engine.api.dependencies.rbac import check_tenant_permission
 from auth_engine.external_services.email.resolver import EmailServiceResolver
 from auth_engine.models import UserORM
 from auth_engine.repositories.user_repo import UserRepository
-from auth_engine.schemas.tenant import TenantInviteRequest
+from auth_engine.schemas.tenant import TenantInviteRequest, TenantUserListResponse
 from auth_engine.schemas.user import UserResponse
 from auth_engine.services.audit_service import AuditService
 from auth_engine.services.auth_service import AuthService
@@ -21,12 +21,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/{tenant_id}/users", response_model=list[UserResponse])
+@router.get("/{tenant_id}/users", response_model=TenantUserListResponse)
 async def list_tenant_users(
     tenant_id: uuid.UUID,
+    limit: int = Query(100, ge=1, le=500),
+    after: uuid.UUID | None = Query(None, description="Cursor: last user id of previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(check_tenant_permission("tenant.users.manage")),
-) -> list[UserResponse]:
+) -> TenantUserListResponse:
     user_repo = UserRepository(db)
     tenant_service = TenantService(user_repo)
 
@@ -34,9 +36,14 @@ async def list_tenant_users(
         users = await tenant_service.list_tenant_users(
             tenant_id=tenant_id,
             actor=current_user,
+            limit=limit,
+            after=after,
         )
 
-        return [UserResponse.model_validate(user) for user in users]
+        return TenantUserListResponse(
+            items=[UserResponse.model_validate(user) for user in users],
+            next_cursor=users[-1].id if len(users) == limit else None,
+        )
 
     except ValueError as exc:
         raise HTTPException(
@@ -80,7 +80,7 @@ class MagicLinkStrategy(TokenBasedStrategy):
         """
         key = f"{MAGIC_LINK_PREFIX}{jti}"
         await self.redis.setex(key, MAGIC_LINK_TTL_SECONDS, "pending")
-        logger.debug(f"[MagicLink] Redis flag set: {key}")
+        logger.debug("[MagicLink] Redis flag set: %s", key)
 
     async def authenticate(self, credentials: dict[str, Any]) -> dict[str, Any]:
         """
@@ -131,7 +131,7 @@ class MagicLinkStrategy(TokenBasedStrategy):
         if deleted == 0:
             raise InvalidTokenError("Magic link was just used. Please request a new one.")
 
-        logger.info(f"[MagicLink] Token consumed for email={email}, jti={jti}")
+        logger.info("[MagicLink] Token consumed for email=%s, jti=%s", email, jti)
 
         user = await self.user_repo.get_by_email(email)
         if not user:
@@ -1,8 +1,20 @@
-from auth_engine.auth_strategies.oauth.authengine import AuthEngineOAuthStrategy
-from auth_engine.auth_strategies.oauth.base_oauth import BaseOAuthStrategy
-from auth_engine.auth_strategies.oauth.github import GitHubOAuthStrategy
-from auth_engine.auth_strategies.oauth.google import GoogleOAuthStrategy
-from auth_engine.auth_strategies.oauth.microsoft import MicrosoftOAuthStrategy
+"""OAuth strategy package.
+
+Strategy classes are imported lazily (PEP 562) so that importing the
+package does not pull in every provider module — typical deployments only
+use one or two providers, and each module drags in httpx/authlib state.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    "BaseOAuthStrategy": "auth_engine.auth_strategies.oauth.base_oauth",
+    "GoogleOAuthStrategy": "auth_engine.auth_strategies.oauth.google",
+    "GitHubOAuthStrategy": "auth_engine.auth_strategies.oauth.github",
+    "MicrosoftOAuthStrategy": "auth_engine.auth_strategies.oauth.microsoft",
+    "AuthEngineOAuthStrategy": "auth_engine.auth_strategies.oauth.authengine",
+}
 
 __all__ = [
     "BaseOAuthStrategy",
@@ -11,3 +23,13 @@ __all__ = [
     "MicrosoftOAuthStrategy",
     "AuthEngineOAuthStrategy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path)
+    obj = getattr(module, name)
+    globals()[name] = obj  # cache so subsequent lookups skip __getattr__
+    return obj
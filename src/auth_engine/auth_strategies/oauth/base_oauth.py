@@ -1,13 +1,17 @@
 # auth_strategies/oauth/base_oauth.py
 
+import json
 import logging
+import operator
+import urllib.parse
 from typing import Any
 
 import httpx
-from authlib.integrations.httpx_client import AsyncOAuth2Client  # type: ignore[import-untyped]
 
 from auth_engine.auth_strategies.base import TokenBasedStrategy
+from auth_engine.auth_strategies.oauth.http import get_shared_client
 from auth_engine.core.exceptions import AuthenticationError
+from auth_engine.core.security import token_manager
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,19 @@ class BaseOAuthStrategy(TokenBasedStrategy):
     USERINFO_URL: str = ""
     DEFAULT_SCOPES: list[str] = []
 
+    # Space-joined DEFAULT_SCOPES, computed once per subclass (see below).
+    _SCOPE_STR: str = ""
+
+    # Token responses share a fixed schema; pull all three fields in one call.
+    _TOKEN_FIELDS = operator.itemgetter("access_token", "refresh_token", "expires_at")
+    _TOKEN_DEFAULTS = dict.fromkeys(("access_token", "refresh_token", "expires_at"))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Prebuild the scope string at class-definition time so
+        # get_authorization_url doesn't re-join it on every request.
+        cls._SCOPE_STR = " ".join(cls.DEFAULT_SCOPES)
+
     def __init__(
         self,
         provider_name: str,
@@ -45,16 +62,6 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
 
-    def get_oauth_client(self) -> AsyncOAuth2Client:
-        """Create a fresh async OAuth2 client for this provider."""
-        return AsyncOAuth2Client(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            redirect_uri=self.redirect_uri,
-            follow_redirects=True,
-            verify=False,  # TODO: remove in production
-        )
-
     async def get_authorization_url(self, state: str, tenant_id: str | None = None) -> str:
         """
         Step 1: Generate the URL to redirect the user to the provider's login page.
@@ -66,21 +73,20 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         Returns:
             Full authorization URL string
         """
-        async with self.get_oauth_client() as client:
-            # Build extra params for the authorization request
-            extra_params: dict[str, Any] = {}
-            if tenant_id:
-                # Encode tenant_id into the state so we get it back in the callback
-                # Format: "{state}:{tenant_id}"
-                state = f"{state}:{tenant_id}"
-
-            uri, _ = client.create_authorization_url(
-                self.AUTHORIZATION_URL,
-                state=state,
-                scope=" ".join(self.DEFAULT_SCOPES),
-                **extra_params,
-            )
-            return uri
+        if tenant_id:
+            # Encode tenant_id into the state so we get it back in the callback
+            # Format: "{state}:{tenant_id}"
+            state = f"{state}:{tenant_id}"
+
+        # Pure string construction — no client, no transport, no I/O.
+        params = {
+            "response_type": "code",
+            "client_id": self.client_id,
+            "redirect_uri": self.redirect_uri,
+            "scope": self._SCOPE_STR,
+            "state": state,
+        }
+        return f"{self.AUTHORIZATION_URL}?{urllib.parse.urlencode(params)}"
 
     async def exchange_code_for_tokens(self, code: str) -> dict[str, Any]:
         """
@@ -92,19 +98,32 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         Returns:
             Token response dict from the provider
         """
-        async with self.get_oauth_client() as client:
-            try:
-                token = await client.fetch_token(
-                    self.TOKEN_URL,
-                    code=code,
-                    grant_type="authorization_code",
-                )
-                return dict(token)
-            except Exception as e:
-                logger.error(f"[{self.provider_name}] Token exchange failed: {e}")
-                raise AuthenticationError(
-                    f"Failed to exchange authorization code with {self.provider_name}"
-                ) from e
+        # The exchange is a plain form-encoded POST with basic-auth client
+        # credentials — do it on the shared pooled client instead of
+        # standing up an authlib AsyncOAuth2Client per login.
+        client = get_shared_client()
+        try:
+            response = await client.post(
+                self.TOKEN_URL,
+                data={
+                    "grant_type": "authorization_code",
+                    "code": code,
+                    "redirect_uri": self.redirect_uri,
+                },
+                auth=(self.client_id, self.client_secret),
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            token: dict[str, Any] = response.json()
+            return token
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            # Deliberately narrow: CancelledError and friends must propagate.
+            # JSONDecodeError covers a 200 with a non-JSON body (some
+            # providers return HTML error pages with a success status).
+            logger.error("[%s] Token exchange failed: %s", self.provider_name, e)
+            raise AuthenticationError(
+                f"Failed to exchange authorization code with {self.provider_name}"
+            ) from e
 
     async def fetch_user_profile(self, access_token: str) -> dict[str, Any]:
         """
@@ -116,22 +135,19 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         Returns:
             Raw profile data from provider (provider-specific format)
         """
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            verify=False,
-        ) as client:  # TODO: remove verify false in production
-            try:
-                response = await client.get(
-                    self.USERINFO_URL,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"[{self.provider_name}] UserInfo fetch failed: {e}")
-                raise AuthenticationError(
-                    f"Failed to fetch user profile from {self.provider_name}"
-                ) from e
+        client = get_shared_client()
+        try:
+            response = await client.get(
+                self.USERINFO_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error("[%s] UserInfo fetch failed: %s", self.provider_name, e)
+            raise AuthenticationError(
+                f"Failed to fetch user profile from {self.provider_name}"
+            ) from e
 
     def normalize_profile(self, raw_profile: dict[str, Any]) -> dict[str, Any]:
         """
@@ -168,7 +184,9 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         # Exchange code → provider tokens
         provider_tokens = await self.exchange_code_for_tokens(code)
 
-        access_token = provider_tokens.get("access_token")
+        access_token, refresh_token, expires_at = self._TOKEN_FIELDS(
+            {**self._TOKEN_DEFAULTS, **provider_tokens}
+        )
         if not access_token:
             raise AuthenticationError(f"No access token received from {self.provider_name}")
 
@@ -188,8 +206,8 @@ class BaseOAuthStrategy(TokenBasedStrategy):
             "provider_name": normalized.get("provider_name"),
             "provider_tokens": {
                 "access_token": access_token,
-                "refresh_token": provider_tokens.get("refresh_token"),
-                "expires_at": provider_tokens.get("expires_at"),
+                "refresh_token": refresh_token,
+                "expires_at": expires_at,
             },
         }
 
@@ -198,8 +216,6 @@ class BaseOAuthStrategy(TokenBasedStrategy):
         Validate an AuthEngine JWT (not the provider token).
         This is the same for all OAuth strategies.
         """
-        from auth_engine.core.security import token_manager
-
         try:
             payload = token_manager.verify_access_token(token)
             return payload
@@ -113,6 +113,13 @@ async def _build_authengine_strategy(
     )
 
 
+# Strategy instances are stateless once built, so memoize them by their full
+# credential tuple. Repeated logins for the same tenant/provider reuse the
+# instance instead of re-allocating one per request (and, for the AuthEngine
+# provider, skip re-running OIDC endpoint discovery).
+_strategy_cache: dict[tuple[str, str, str, str | None, str | None], BaseOAuthStrategy] = {}
+
+
 async def _build_strategy(
     provider: str,
     *,
@@ -120,6 +127,29 @@ async def _build_strategy(
     client_secret: str,
     redirect_uri: str | None,
     authengine_base_url: str | None = None,
+) -> BaseOAuthStrategy:
+    """Return a strategy for the given credentials, cached across requests."""
+    cache_key = (provider, client_id, client_secret, redirect_uri, authengine_base_url)
+    strategy = _strategy_cache.get(cache_key)
+    if strategy is None:
+        strategy = await _create_strategy(
+            provider,
+            client_id=client_id,
+            client_secret=client_secret,
+            redirect_uri=redirect_uri,
+            authengine_base_url=authengine_base_url,
+        )
+        _strategy_cache[cache_key] = strategy
+    return strategy
+
+
+async def _create_strategy(
+    provider: str,
+    *,
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str | None,
+    authengine_base_url: str | None = None,
 ) -> BaseOAuthStrategy:
     """Instantiate a strategy with the given credentials."""
 
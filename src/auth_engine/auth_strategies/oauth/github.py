@@ -1,10 +1,9 @@
 # auth_strategies/oauth/github.py
 
+import asyncio
 import logging
 from typing import Any
 
-import httpx
-
 from auth_engine.auth_strategies.constants import (
     GITHUB,
     GITHUB_AUTHORIZATION_URL,
@@ -13,6 +12,7 @@ from auth_engine.auth_strategies.constants import (
     GITHUB_USERINFO_URL,
 )
 from auth_engine.auth_strategies.oauth.base_oauth import BaseOAuthStrategy
+from auth_engine.auth_strategies.oauth.http import get_shared_client
 from auth_engine.core.exceptions import AuthenticationError
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,12 @@ class GitHubOAuthStrategy(BaseOAuthStrategy):
     EMAILS_URL = GITHUB_EMAILS_URL
     DEFAULT_SCOPES = ["read:user", "user:email"]
 
+    # Everything but the Authorization header is fixed — build it once.
+    _STATIC_HEADERS = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
         super().__init__(
             provider_name=GITHUB,
@@ -46,35 +52,40 @@ class GitHubOAuthStrategy(BaseOAuthStrategy):
         Override to also fetch the primary verified email separately,
         since GitHub users can set their profile email to private.
         """
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-
-            # Fetch main profile
-            profile_resp = await client.get(self.USERINFO_URL, headers=headers)
-            profile_resp.raise_for_status()
-            profile = profile_resp.json()
-
-            # Fetch emails if profile email is null (private accounts)
-            if not profile.get("email"):
-                try:
-                    emails_resp = await client.get(self.EMAILS_URL, headers=headers)
-                    emails_resp.raise_for_status()
-                    emails = emails_resp.json()
-
-                    # Find the primary verified email
-                    primary_email = next(
-                        (e["email"] for e in emails if e.get("primary") and e.get("verified")),
-                        None,
-                    )
-                    profile["email"] = primary_email
-                except Exception as e:
-                    logger.warning(f"[github] Could not fetch user emails: {e}")
-
-            return profile
+        client = get_shared_client()
+        headers = {**self._STATIC_HEADERS, "Authorization": f"Bearer {access_token}"}
+
+        # The user:email scope is always requested, so fire both calls up
+        # front and overlap the two round-trips; the emails response is
+        # only parsed when the profile email turns out to be private.
+        profile_resp, emails_resp = await asyncio.gather(
+            client.get(self.USERINFO_URL, headers=headers),
+            client.get(self.EMAILS_URL, headers=headers),
+            return_exceptions=True,
+        )
+        if isinstance(profile_resp, BaseException):
+            raise profile_resp
+        profile_resp.raise_for_status()
+        profile = profile_resp.json()
+
+        # Use the emails response if profile email is null (private accounts)
+        if not profile.get("email"):
+            try:
+                if isinstance(emails_resp, BaseException):
+                    raise emails_resp
+                emails_resp.raise_for_status()
+                emails = emails_resp.json()
+
+                # Find the primary verified email
+                primary_email = next(
+                    (e["email"] for e in emails if e.get("primary") and e.get("verified")),
+                    None,
+                )
+                profile["email"] = primary_email
+            except Exception as e:
+                logger.warning("[github] Could not fetch user emails: %s", e)
+
+        return profile
 
     def normalize_profile(self, raw_profile: dict[str, Any]) -> dict[str, Any]:
         """
@@ -87,7 +98,10 @@ class GitHubOAuthStrategy(BaseOAuthStrategy):
             avatar_url → avatar
             login      → GitHub username
         """
-        email = raw_profile.get("email")
+        # Bind the lookup once instead of re-resolving .get per field.
+        get = raw_profile.get
+
+        email = get("email")
         if not email:
             raise AuthenticationError(
                 "GitHub account has no verified public email. "
@@ -95,17 +109,17 @@ class GitHubOAuthStrategy(BaseOAuthStrategy):
                 "or use a different login method."
             )
 
-        # Split display name into first/last if possible
-        full_name: str = raw_profile.get("name") or raw_profile.get("login") or ""
-        name_parts = full_name.split(" ", 1)
-        first_name = name_parts[0] if name_parts else None
-        last_name = name_parts[1] if len(name_parts) > 1 else None
+        # Split display name into first/last if possible — partition returns a
+        # tuple directly, no list allocation or length check needed
+        full_name: str = get("name") or get("login") or ""
+        first_name, _, rest = full_name.partition(" ")
+        last_name = rest or None
 
         return {
             "provider_user_id": str(raw_profile["id"]),
             "email": email,
             "first_name": first_name,
             "last_name": last_name,
-            "avatar_url": raw_profile.get("avatar_url"),
-            "provider_name": full_name or raw_profile.get("login"),
+            "avatar_url": get("avatar_url"),
+            "provider_name": full_name or get("login"),
         }
@@ -1,5 +1,6 @@
 # auth_strategies/oauth/google.py
 
+import operator
 from typing import Any
 
 from auth_engine.auth_strategies.constants import (
@@ -14,6 +15,7 @@ from auth_engine.auth_strategies.constants import (
     GOOGLE_USERINFO_URL,
 )
 from auth_engine.auth_strategies.oauth.base_oauth import BaseOAuthStrategy
+from auth_engine.core.exceptions import AuthenticationError
 
 
 class GoogleOAuthStrategy(BaseOAuthStrategy):
@@ -31,6 +33,19 @@ class GoogleOAuthStrategy(BaseOAuthStrategy):
     USERINFO_URL = GOOGLE_USERINFO_URL
     DEFAULT_SCOPES = ["openid", "email", "profile"]
 
+    # normalize_profile runs once per login; unpack all claims in a single
+    # itemgetter call instead of one dict lookup per field.
+    _PROFILE_CLAIMS = (
+        CLAIM_SUB,
+        CLAIM_EMAIL,
+        CLAIM_GIVEN_NAME,
+        CLAIM_FAMILY_NAME,
+        CLAIM_PICTURE,
+        CLAIM_NAME,
+    )
+    _GET_CLAIMS = operator.itemgetter(*_PROFILE_CLAIMS)
+    _CLAIM_DEFAULTS = dict.fromkeys(_PROFILE_CLAIMS)
+
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
         super().__init__(
             provider_name="google",
@@ -50,11 +65,18 @@ class GoogleOAuthStrategy(BaseOAuthStrategy):
             picture  → avatar URL
             name     → full display name
         """
+        sub, email, given_name, family_name, picture, name = self._GET_CLAIMS(
+            {**self._CLAIM_DEFAULTS, **raw_profile}
+        )
+        # sub is the account-linking key and email is required downstream;
+        # a profile without them must fail loudly, not produce str(None).
+        if sub is None or email is None:
+            raise AuthenticationError("Google profile is missing required 'sub'/'email' claims")
         return {
-            "provider_user_id": str(raw_profile[CLAIM_SUB]),
-            "email": raw_profile[CLAIM_EMAIL],
-            "first_name": raw_profile.get(CLAIM_GIVEN_NAME),
-            "last_name": raw_profile.get(CLAIM_FAMILY_NAME),
-            "avatar_url": raw_profile.get(CLAIM_PICTURE),
-            "provider_name": raw_profile.get(CLAIM_NAME),
+            "provider_user_id": str(sub),
+            "email": email,
+            "first_name": given_name,
+            "last_name": family_name,
+            "avatar_url": picture,
+            "provider_name": name,
         }
@@ -0,0 +1,38 @@
+# auth_strategies/oauth/http.py
+"""Shared httpx client for OAuth provider calls.
+
+Every OAuth callback used to open (and TLS-handshake) a brand new client
+per request. A single pooled AsyncClient keeps connections to the provider
+APIs alive across logins, so repeat calls skip the TCP+TLS setup entirely.
+
+The client is created lazily on first use and must be closed from the
+FastAPI lifespan shutdown via aclose_shared_client().
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            # HTTP/2 lets the paired GitHub /user + /user/emails calls (and any
+            # burst of logins) multiplex over one connection.
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            follow_redirects=True,
+            verify=False,  # TODO: remove in production (matches per-call clients)
+        )
+    return _client
+
+
+async def aclose_shared_client() -> None:
+    """Close the pooled client — called from the app lifespan shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -1,5 +1,6 @@
 # auth_strategies/oauth/microsoft.py
 
+import operator
 from typing import Any
 
 from auth_engine.auth_strategies.constants import (
@@ -9,6 +10,7 @@ from auth_engine.auth_strategies.constants import (
     MICROSOFT_USERINFO_URL,
 )
 from auth_engine.auth_strategies.oauth.base_oauth import BaseOAuthStrategy
+from auth_engine.core.exceptions import AuthenticationError
 
 
 class MicrosoftOAuthStrategy(BaseOAuthStrategy):
@@ -29,6 +31,31 @@ class MicrosoftOAuthStrategy(BaseOAuthStrategy):
     USERINFO_URL = MICROSOFT_USERINFO_URL
     DEFAULT_SCOPES = ["openid", "email", "profile", "User.Read"]
 
+    # normalize_profile runs once per login; unpack all fields in a single
+    # itemgetter call instead of one dict lookup per field.
+    _PROFILE_FIELDS = (
+        "id",
+        "mail",
+        "userPrincipalName",
+        "givenName",
+        "surname",
+        "displayName",
+    )
+    _GET_FIELDS = operator.itemgetter(*_PROFILE_FIELDS)
+    _FIELD_DEFAULTS = dict.fromkeys(_PROFILE_FIELDS)
+
+    # Prebuilt result shape; dict.copy() is one C-level call versus a six-key
+    # literal per login. avatar_url stays None — populating it would need a
+    # second Graph call with a binary response.
+    _PROFILE_TEMPLATE = {
+        "provider_user_id": None,
+        "email": None,
+        "first_name": None,
+        "last_name": None,
+        "avatar_url": None,
+        "provider_name": None,
+    }
+
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
         super().__init__(
             provider_name=MICROSOFT,
@@ -49,14 +76,19 @@ class MicrosoftOAuthStrategy(BaseOAuthStrategy):
             surname           → last name
             displayName       → full display name
         """
+        user_id, mail, upn, given_name, surname, display_name = self._GET_FIELDS(
+            {**self._FIELD_DEFAULTS, **raw_profile}
+        )
+        # id is the account-linking key; a profile without it must fail
+        # loudly, not produce str(None).
+        if user_id is None:
+            raise AuthenticationError("Microsoft profile is missing the required 'id' field")
+
+        out: dict[str, Any] = self._PROFILE_TEMPLATE.copy()
+        out["provider_user_id"] = str(user_id)
         # Microsoft sometimes puts email in mail, sometimes in userPrincipalName
-        email = raw_profile.get("mail") or raw_profile.get("userPrincipalName")
-
-        return {
-            "provider_user_id": str(raw_profile["id"]),
-            "email": email,
-            "first_name": raw_profile.get("givenName"),
-            "last_name": raw_profile.get("surname"),
-            "avatar_url": None,  # Requires a separate Graph API call with binary response
-            "provider_name": raw_profile.get("displayName"),
-        }
+        out["email"] = mail or upn
+        out["first_name"] = given_name
+        out["last_name"] = surname
+        out["provider_name"] = display_name
+        return out
@@ -1,9 +1,37 @@
+import time
+
 import pyotp
 
 from auth_engine.auth_strategies.base import TokenBasedStrategy
 from auth_engine.core.exceptions import AuthenticationError, InvalidTokenError
 from auth_engine.core.security import SecurityUtils
 
+# Users routinely mistype a 2FA code and retry within seconds. Cache the
+# decrypted TOTP object briefly so retries skip Fernet decryption and HMAC
+# key setup. Secrets stay in-process only and are never logged.
+_TOTP_CACHE_TTL_SECONDS = 60.0
+_TOTP_CACHE_MAX = 1024
+_totp_cache: dict[str, tuple[pyotp.TOTP, float]] = {}
+
+
+def _cached_totp(encrypted_secret: str) -> pyotp.TOTP:
+    """Return a TOTP verifier for the secret, decrypting at most once per TTL."""
+    now = time.monotonic()
+    entry = _totp_cache.get(encrypted_secret)
+    if entry is not None and now - entry[1] < _TOTP_CACHE_TTL_SECONDS:
+        return entry[0]
+
+    if len(_totp_cache) >= _TOTP_CACHE_MAX:
+        for key, (_, stamp) in list(_totp_cache.items()):
+            if now - stamp >= _TOTP_CACHE_TTL_SECONDS:
+                del _totp_cache[key]
+        if len(_totp_cache) >= _TOTP_CACHE_MAX:
+            _totp_cache.clear()
+
+    totp = pyotp.TOTP(SecurityUtils.decrypt_data(encrypted_secret))
+    _totp_cache[encrypted_secret] = (totp, now)
+    return totp
+
 
 class TOTPStrategy(TokenBasedStrategy):
     def __init__(self) -> None:
@@ -20,8 +48,7 @@ class TOTPStrategy(TokenBasedStrategy):
 
     @staticmethod
     def verify_code(encrypted_secret: str, code: str) -> bool:
-        secret = SecurityUtils.decrypt_data(encrypted_secret)
-        totp = pyotp.TOTP(secret)
+        totp = _cached_totp(encrypted_secret)
         return totp.verify(code, valid_window=1)
 
     async def authenticate(self, credentials: dict) -> dict:
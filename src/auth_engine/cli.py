@@ -13,6 +13,23 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent
 
 
+def _run_alembic(args: list[str]) -> None:
+    """
+    Hand the process over to alembic (alembic.ini lives at the project root).
+
+    These commands are one-shots, so replace the current process image with
+    alembic instead of idling a parent interpreter around a child process.
+    """
+    project_root = get_project_root()
+    alembic_path = str(Path(sys.executable).parent / "alembic")
+    if sys.platform == "win32":
+        # execv semantics are unreliable on Windows; keep the child process there.
+        subprocess.run([alembic_path, *args], cwd=project_root, check=True)
+        return
+    os.chdir(project_root)
+    os.execv(alembic_path, [alembic_path, *args])
+
+
 @app.command()
 def run(
     host: str = "0.0.0.0",
@@ -40,9 +57,7 @@ def migrate() -> None:
     """
     Run Alembic migrations
     """
-    project_root = get_project_root()
-    alembic_path = str(Path(sys.executable).parent / "alembic")
-    subprocess.run([alembic_path, "upgrade", "head"], cwd=project_root, check=True)
+    _run_alembic(["upgrade", "head"])
 
 
 @app.command()
@@ -50,13 +65,7 @@ def makemigration(message: str) -> None:
     """
     Create a new migration (run from auth-engine root where alembic.ini lives)
     """
-    project_root = get_project_root()
-    alembic_path = str(Path(sys.executable).parent / "alembic")
-    subprocess.run(
-        [alembic_path, "revision", "--autogenerate", "-m", message],
-        cwd=project_root,
-        check=True,
-    )
+    _run_alembic(["revision", "--autogenerate", "-m", message])
 
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import json
+from functools import lru_cache
+from typing import Annotated, Any
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -33,6 +37,10 @@ class Settings(BaseSettings):
         default=False,
         description="Enable SSL for PostgreSQL (set true for hosted databases)",
     )
+    SQL_ECHO: bool = Field(
+        default=False,
+        description="Log every SQL statement (independent of DEBUG — very verbose)",
+    )
 
     # MongoDB specific
     MONGODB_DB_NAME: str = Field(..., description="MongoDB database name")
@@ -50,6 +58,11 @@ class Settings(BaseSettings):
     # OIDC RS256 signing key (mount into the container; must be readable by the app user)
     OIDC_PRIVATE_KEY_PATH: str = Field(..., description="Path to OIDC RS256 private key PEM")
 
+    # Argon2 password hashing (defaults match argon2-cffi; tune per hardware)
+    ARGON2_TIME_COST: int = Field(default=3, ge=1)
+    ARGON2_MEMORY_COST_KIB: int = Field(default=65536, ge=8)
+    ARGON2_PARALLELISM: int = Field(default=4, ge=1)
+
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = Field(..., ge=1)
     RATE_LIMIT_ENABLED: bool = Field(...)
@@ -65,7 +78,33 @@ class Settings(BaseSettings):
     WEBAUTHN_RP_ID: str = Field(..., description="WebAuthn Relying Party ID")
 
     # CORS Settings
-    CORS_ORIGINS: list[str] = Field(..., description="List of allowed origins for CORS")
+    # NoDecode keeps pydantic-settings from json-decoding the raw env value
+    # itself (which would reject the comma form before the validator runs).
+    CORS_ORIGINS: Annotated[list[str], NoDecode] = Field(
+        ..., description="List of allowed origins for CORS"
+    )
+
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
+    def parse_cors_origins(cls, v: Any) -> Any:
+        """Accept either a JSON array or a plain comma-separated string.
+
+        One branch on the leading character — a malformed JSON array should
+        fail loudly rather than being silently treated as one big origin.
+        """
+        if not isinstance(v, str):
+            return v
+        s = v.strip()
+        if s[:1] == "[":
+            return json.loads(s)
+        return [origin.strip() for origin in s.split(",") if origin.strip()]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once per process — env-file parsing and validation
+    run on the first call only, no matter how many importers ask."""
+    return Settings()  # type: ignore[call-arg]
 
 
-settings = Settings()  # type: ignore[call-arg]
+settings = get_settings()
@@ -1,6 +1,6 @@
 # core/exceptions.py
 
-from typing import Any
+from typing import Any, Final
 
 from fastapi import HTTPException, status
 
@@ -71,23 +71,26 @@ class NotFoundError(AuthEngineException):
         super().__init__(message, error_code="NOT_FOUND")
 
 
+# Built once — the converter runs on every failed login / rate-limited
+# request, so don't reallocate an 11-entry dict per raise.
+_STATUS_MAP: Final[dict[str, int]] = {
+    "INVALID_CREDENTIALS": status.HTTP_401_UNAUTHORIZED,
+    "USER_NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "USER_ALREADY_EXISTS": status.HTTP_409_CONFLICT,
+    "INVALID_TOKEN": status.HTTP_401_UNAUTHORIZED,
+    "TOKEN_EXPIRED": status.HTTP_401_UNAUTHORIZED,
+    "INVALID_OTP": status.HTTP_401_UNAUTHORIZED,
+    "WEAK_PASSWORD": status.HTTP_400_BAD_REQUEST,
+    "RATE_LIMIT_EXCEEDED": status.HTTP_429_TOO_MANY_REQUESTS,
+    "SESSION_EXPIRED": status.HTTP_401_UNAUTHORIZED,
+    "MAX_SESSIONS_EXCEEDED": status.HTTP_403_FORBIDDEN,
+    "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+}
+
+
 # HTTP Exception converters
 def convert_to_http_exception(exc: AuthEngineException) -> HTTPException:
-    status_map = {
-        "INVALID_CREDENTIALS": status.HTTP_401_UNAUTHORIZED,
-        "USER_NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "USER_ALREADY_EXISTS": status.HTTP_409_CONFLICT,
-        "INVALID_TOKEN": status.HTTP_401_UNAUTHORIZED,
-        "TOKEN_EXPIRED": status.HTTP_401_UNAUTHORIZED,
-        "INVALID_OTP": status.HTTP_401_UNAUTHORIZED,
-        "WEAK_PASSWORD": status.HTTP_400_BAD_REQUEST,
-        "RATE_LIMIT_EXCEEDED": status.HTTP_429_TOO_MANY_REQUESTS,
-        "SESSION_EXPIRED": status.HTTP_401_UNAUTHORIZED,
-        "MAX_SESSIONS_EXCEEDED": status.HTTP_403_FORBIDDEN,
-        "NOT_FOUND": status.HTTP_404_NOT_FOUND,
-    }
-
-    status_code = status_map.get(exc.error_code or "", status.HTTP_500_INTERNAL_SERVER_ERROR)
+    status_code = _STATUS_MAP.get(exc.error_code or "", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     return HTTPException(
         status_code=status_code,
@@ -1,3 +1,5 @@
+import asyncio
+
 from sqlalchemy import text
 
 import auth_engine.core.mongodb as mongodb
@@ -11,12 +13,30 @@ async def check_postgres() -> None:
 
 
 async def check_mongodb() -> None:
-    if not mongodb.mongo_client:
-        raise RuntimeError("MongoDB client is not initialized")
-    await mongodb.mongo_client.admin.command("ping")
+    await mongodb.get_mongo_client().admin.command("ping")
 
 
 async def check_redis() -> None:
     if not redis_client.client:
         raise RuntimeError("Redis client is not initialized")
     await redis_client.client.ping()
+
+
+# A hung backend should fail its own probe, not stall the whole health check.
+_CHECK_TIMEOUT_SECONDS = 1.0
+
+
+async def check_all() -> dict[str, bool]:
+    """Probe all three backends concurrently; the probes are independent,
+    so the total cost is the slowest round trip rather than the sum."""
+    results = await asyncio.gather(
+        asyncio.wait_for(check_postgres(), _CHECK_TIMEOUT_SECONDS),
+        asyncio.wait_for(check_mongodb(), _CHECK_TIMEOUT_SECONDS),
+        asyncio.wait_for(check_redis(), _CHECK_TIMEOUT_SECONDS),
+        return_exceptions=True,
+    )
+    return {
+        "postgres": not isinstance(results[0], BaseException),
+        "mongodb": not isinstance(results[1], BaseException),
+        "redis": not isinstance(results[2], BaseException),
+    }
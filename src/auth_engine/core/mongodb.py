@@ -9,11 +9,38 @@ mongo_db: AsyncIOMotorDatabase | None = None
 async def init_mongo() -> None:
     global mongo_client, mongo_db
 
-    mongo_client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=5000)
+    mongo_client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        serverSelectionTimeoutMS=5000,
+        maxPoolSize=50,
+        minPoolSize=10,
+        # zlib ships with the server and the stdlib — no extra wheel needed
+        # (zstd/snappy would each pull in a native dependency).
+        compressors="zlib",
+        retryReads=True,
+        retryWrites=True,
+    )
 
     mongo_db = mongo_client.get_default_database()
 
+    # Force the handshake now so the first real query doesn't pay it.
+    await mongo_client.admin.command("ping")
+
 
 async def close_mongo() -> None:
     if mongo_client:
         mongo_client.close()
+
+
+# Typed accessors: call sites get a non-Optional handle and the "is it
+# initialized?" branch lives in exactly one place per object.
+def get_mongo_client() -> AsyncIOMotorClient:
+    if mongo_client is None:
+        raise RuntimeError("MongoDB client is not initialized")
+    return mongo_client
+
+
+def get_mongo_db() -> AsyncIOMotorDatabase:
+    if mongo_db is None:
+        raise RuntimeError("MongoDB is not initialized")
+    return mongo_db
@@ -1,4 +1,5 @@
 import logging
+import socket
 
 import redis
 import redis.asyncio as aioredis
@@ -7,6 +8,16 @@ from auth_engine.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Aggressive keepalive probes surface dead NAT'd connections in ~2 minutes
+# instead of stalling a request for the full TCP timeout. The constants are
+# platform-dependent (Linux has all three), so build the dict from whatever
+# this platform exposes.
+_KEEPALIVE_OPTIONS = {
+    opt: value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4))
+    if (opt := getattr(socket, name, None)) is not None
+}
+
 
 class RedisClient:
     client: aioredis.Redis | None = None
@@ -14,13 +25,17 @@ class RedisClient:
     async def connect(self) -> None:
         url = str(settings.REDIS_URL)
 
-        self.client = aioredis.from_url(
+        # BlockingConnectionPool waits (up to `timeout`) for a free connection
+        # under burst instead of raising ConnectionError at the cap.
+        pool: aioredis.BlockingConnectionPool = aioredis.BlockingConnectionPool.from_url(
             url,
             max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=5,
             decode_responses=True,
             socket_connect_timeout=10,
             socket_timeout=10,
             socket_keepalive=True,
+            socket_keepalive_options=_KEEPALIVE_OPTIONS,
             retry_on_timeout=True,
             retry_on_error=[
                 redis.exceptions.ConnectionError,
@@ -28,6 +43,7 @@ class RedisClient:
             ],
             health_check_interval=30,
         )
+        self.client = aioredis.Redis(connection_pool=pool)
 
     async def disconnect(self) -> None:
         if self.client:
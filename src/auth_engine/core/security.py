@@ -1,28 +1,74 @@
 # core/security.py
 
-import re
+import base64
+import hashlib
 import secrets
-import string
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cryptography.fernet import Fernet
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from auth_engine.core import settings
 from auth_engine.schemas.tenant_auth_config import resolve_password_policy
 
+# Still used for OTP hashing in auth_service; password hashing goes through
+# the direct argon2-cffi hasher below.
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Direct argon2-cffi hasher — skips passlib's per-call context/identifier
+# machinery, and its parameters are deployment-tunable. It verifies the
+# passlib-era encoded hashes too (same $argon2id$ format).
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# validate_password_strength classifies every character in one pass rather
+# than scanning the password once per rule.
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Build the signing/verification key object once — jose otherwise re-derives
+# it from the raw secret on every encode/decode call. With HS256 the actual
+# verification stays on OpenSSL's HMAC-SHA256 fast path.
+_JWT_SIGNING_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """One cipher per process — key derivation (SHA-256 + base64) and
+    Fernet construction used to run on every encrypt/decrypt call."""
+    digest = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+@lru_cache(maxsize=4096)
+def _decrypt_cached(encrypted_data: str) -> str:
+    # The ciphertext is already a unique, integrity-checked key, so repeated
+    # decrypts of the same value (tenant config credentials) become a dict
+    # lookup. Only route low-cardinality config secrets through this — user
+    # payloads would just churn the cache.
+    return _get_fernet().decrypt(encrypted_data.encode()).decode()
+
 
 class SecurityUtils:
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        return _password_hasher.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
 
     @staticmethod
     def validate_password_strength(
@@ -35,57 +81,62 @@ class SecurityUtils:
         if len(password) < min_length:
             return False, f"Password must be at least {min_length} characters"
 
-        if rules["require_uppercase"] and not re.search(r"[A-Z]", password):
+        has_upper = has_lower = has_digit = has_special = False
+        for ch in password:
+            if "A" <= ch <= "Z":
+                has_upper = True
+            elif "a" <= ch <= "z":
+                has_lower = True
+            elif ch.isdecimal():  # same set as the old \d regex
+                has_digit = True
+            elif ch in _SPECIAL_CHARS:
+                has_special = True
+
+        if rules["require_uppercase"] and not has_upper:
             return False, "Password must contain at least one uppercase letter"
 
-        if rules["require_lowercase"] and not re.search(r"[a-z]", password):
+        if rules["require_lowercase"] and not has_lower:
             return False, "Password must contain at least one lowercase letter"
 
-        if rules["require_digit"] and not re.search(r"\d", password):
+        if rules["require_digit"] and not has_digit:
             return False, "Password must contain at least one digit"
 
-        if rules["require_special"] and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if rules["require_special"] and not has_special:
             return False, "Password must contain at least one special character"
 
         return True, ""
 
     @staticmethod
     def generate_random_token(length: int = 32) -> str:
-        alphabet = string.ascii_letters + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        # One CSPRNG read instead of `length` secrets.choice loop iterations;
+        # the URL-safe alphabet (letters, digits, "-", "_") suits every caller.
+        return secrets.token_urlsafe(length)[:length]
 
     @staticmethod
     def generate_otp(length: int = 6) -> str:
-        return "".join(secrets.choice(string.digits) for _ in range(length))
-
-    @staticmethod
-    def _get_fernet_key() -> bytes:
-        import base64
-        import hashlib
-
-        # Derive a 32-byte URL-safe base64-encoded key from the secret key
-        digest = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
-        return base64.urlsafe_b64encode(digest)
+        return f"{secrets.randbelow(10**length):0{length}d}"
 
     @staticmethod
     def encrypt_data(data: str) -> str:
-        from cryptography.fernet import Fernet
-
         if not data:
             return ""
 
-        f = Fernet(SecurityUtils._get_fernet_key())
-        return f.encrypt(data.encode()).decode()
+        return _get_fernet().encrypt(data.encode()).decode()
 
     @staticmethod
     def decrypt_data(encrypted_data: str) -> str:
-        from cryptography.fernet import Fernet
+        if not encrypted_data:
+            return ""
 
+        return _get_fernet().decrypt(encrypted_data.encode()).decode()
+
+    @staticmethod
+    def decrypt_config_data(encrypted_data: str) -> str:
+        """Memoized decrypt for stable config ciphertexts (tenant credentials)."""
         if not encrypted_data:
             return ""
 
-        f = Fernet(SecurityUtils._get_fernet_key())
-        return f.decrypt(encrypted_data.encode()).decode()
+        return _decrypt_cached(encrypted_data)
 
 
 class TokenManager:
@@ -93,10 +144,13 @@ class TokenManager:
     def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
         to_encode = data.copy()
 
+        # Epoch ints go straight into the claims — jose would otherwise convert
+        # datetime objects to exactly these values internally.
+        now = int(time.time())
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
         # Default scope / tenant_id claims (callers override for tenant-scoped tokens)
         if "scope" not in to_encode:
@@ -107,7 +161,7 @@ class TokenManager:
         to_encode.update(
             {
                 "exp": expire,
-                "iat": datetime.utcnow(),
+                "iat": now,
                 "iss": settings.JWT_ISSUER,
                 "aud": settings.JWT_AUDIENCE,
             }
@@ -115,24 +169,23 @@ class TokenManager:
         if "type" not in to_encode:
             to_encode["type"] = "access"
 
-        encoded_jwt = jwt.encode(
-            to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-        )
+        encoded_jwt = jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
         return encoded_jwt
 
     @staticmethod
     def create_refresh_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
         to_encode = data.copy()
 
+        now = int(time.time())
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+            expire = now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
         to_encode.update(
             {
                 "exp": expire,
-                "iat": datetime.utcnow(),
+                "iat": now,
                 "iss": settings.JWT_ISSUER,
                 "aud": settings.JWT_AUDIENCE,
             }
@@ -140,9 +193,7 @@ class TokenManager:
         if "type" not in to_encode:
             to_encode["type"] = "refresh"
 
-        encoded_jwt = jwt.encode(
-            to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-        )
+        encoded_jwt = jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
         return encoded_jwt
 
     @staticmethod
@@ -150,8 +201,8 @@ class TokenManager:
         try:
             payload = jwt.decode(
                 token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM],
+                _JWT_SIGNING_KEY,
+                algorithms=_JWT_ALGORITHMS,
                 audience=settings.JWT_AUDIENCE,
                 issuer=settings.JWT_ISSUER,
             )
@@ -1,8 +1,30 @@
-from jinja2 import Environment, PackageLoader, select_autoescape
+import os
+import tempfile
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, select_autoescape
+
+# Templates only change with a deploy, so skip the per-render stat of the
+# source file (auto_reload=False) and persist compiled bytecode across
+# processes so cold starts don't reparse every template.
+#
+# FileSystemBytecodeCache unmarshals code objects with no integrity check,
+# so the directory must be exclusively ours: uid-suffixed name, 0o700, and
+# if something else got there first (pre-created by another local user on
+# a shared host) fall back to a fresh private directory rather than
+# loading bytecode we didn't write.
+_bytecode_cache_dir = Path(tempfile.gettempdir()) / f"auth-engine-jinja-cache-{os.getuid()}"
+_bytecode_cache_dir.mkdir(mode=0o700, exist_ok=True)
+_stat = _bytecode_cache_dir.stat()
+if _stat.st_uid != os.getuid() or _stat.st_mode & 0o077:
+    _bytecode_cache_dir = Path(tempfile.mkdtemp(prefix="auth-engine-jinja-cache-"))
 
 # Initialize Jinja2 environment using PackageLoader
 # This automatically finds the 'templates' folder within the 'auth_engine' package
 jinja_env = Environment(
     loader=PackageLoader("auth_engine", "templates"),
     autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(str(_bytecode_cache_dir)),
 )
@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+# frozen makes configs hashable (usable as cache keys); slots drops the
+# per-instance __dict__ and speeds up field access in the send path.
+@dataclass(slots=True, frozen=True)
 class EmailProviderConfig:
     provider_type: str
     api_key: str
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 
 from auth_engine.external_services.email.base import EmailProvider, EmailProviderConfig
 from auth_engine.external_services.email.providers.console import ConsoleEmailProvider
@@ -11,18 +12,29 @@ logger = logging.getLogger(__name__)
 
 
 class EmailServiceFactory:
+    # Lowercase provider name → implementation; the enum values are already
+    # lowercase, so enum members and raw strings dispatch through one lookup.
+    # Typed as a callable rather than type[EmailProvider] — the ABC defines
+    # no __init__, so the class-object form doesn't type-check the
+    # config argument the concrete providers all take.
+    _REGISTRY: dict[str, Callable[[EmailProviderConfig], EmailProvider]] = {
+        EmailProviderType.SENDGRID.value: SendGridEmailProvider,
+        EmailProviderType.SES.value: SESEmailProvider,
+        EmailProviderType.SMTP.value: SMTPEmailProvider,
+    }
+
+    @classmethod
+    def register(
+        cls, name: str, provider_cls: Callable[[EmailProviderConfig], EmailProvider]
+    ) -> None:
+        """Register an additional provider implementation under a lowercase name."""
+        cls._REGISTRY[name.lower()] = provider_cls
+
     @staticmethod
     def create(config: EmailProviderConfig) -> EmailProvider:
-        provider_type = str(config.provider_type).lower()
-
-        if provider_type == EmailProviderType.SENDGRID.value or provider_type == "sendgrid":
-            return SendGridEmailProvider(config)
-
-        if provider_type == EmailProviderType.SES.value or provider_type == "ses":
-            return SESEmailProvider(config)
-
-        if provider_type == EmailProviderType.SMTP.value or provider_type == "smtp":
-            return SMTPEmailProvider(config)
+        provider_cls = EmailServiceFactory._REGISTRY.get(str(config.provider_type).lower())
+        if provider_cls is not None:
+            return provider_cls(config)
 
         logger.warning(f"Unknown provider type: {config.provider_type}. Falling back to Console.")
         return ConsoleEmailProvider()
@@ -1,13 +1,38 @@
-import asyncio
 import logging
 
-from sendgrid import SendGridAPIClient  # type: ignore[import-untyped]
-from sendgrid.helpers.mail import Mail  # type: ignore[import-untyped]
+import httpx
 
 from auth_engine.external_services.email.base import EmailProvider, EmailProviderConfig
 
 logger = logging.getLogger(__name__)
 
+# SendGrid's v3 mail-send schema is small enough to build by hand; posting it
+# straight through httpx keeps the send path pure-asyncio instead of burning a
+# thread-pool worker per in-flight email via the blocking SDK.
+_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared pooled client for the SendGrid API, creating it lazily."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+        )
+    return _client
+
+
+async def aclose_sendgrid_client() -> None:
+    """Close the pooled client — called from the app lifespan shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
 
 class SendGridEmailProvider(EmailProvider):
     def __init__(self, config: EmailProviderConfig) -> None:
@@ -15,32 +40,32 @@ class SendGridEmailProvider(EmailProvider):
         self.default_sender = config.from_email
         if not self.api_key:
             logger.warning("Email Provider API Key is not set/empty for this provider.")
+        # The auth header never changes for a provider instance — build it once.
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
 
     async def send_email(self, to_emails: list[str], subject: str, html_content: str) -> bool:
         if not self.api_key:
             logger.error("Cannot send email: API Key is missing.")
             return False
 
-        message = Mail(
-            from_email=self.default_sender,
-            to_emails=to_emails,
-            subject=subject,
-            html_content=html_content,
-        )
+        body = {
+            "personalizations": [{"to": [{"email": e} for e in to_emails]}],
+            "from": {"email": self.default_sender},
+            "subject": subject,
+            "content": [{"type": "text/html", "value": html_content}],
+        }
 
         try:
-            sg = SendGridAPIClient(self.api_key)
-            # Run the synchronous send call in a thread pool using asyncio.to_thread
-            response = await asyncio.to_thread(sg.send, message)
+            response = await _get_client().post(_SEND_URL, json=body, headers=self._headers)
 
             if 200 <= response.status_code < 300:
-                logger.info(f"Email sent successfully to {to_emails}")
+                logger.info("Email sent successfully to %s", to_emails)
                 return True
             else:
-                logger.error(f"Failed to send email. Status Code: {response.status_code}")
-                logger.error(f"Response Body: {response.body}")
+                logger.error("Failed to send email. Status Code: %s", response.status_code)
+                logger.error("Response Body: %s", response.text)
                 return False
 
-        except Exception as e:
-            logger.error(f"Error sending email via SendGrid: {str(e)}")
+        except httpx.HTTPError as e:
+            logger.error("Error sending email via SendGrid: %s", e)
             return False
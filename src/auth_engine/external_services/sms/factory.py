@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 
 from auth_engine.external_services.sms.base import SMSProvider, SMSProviderConfig
 from auth_engine.external_services.sms.providers.android_gateway import AndroidGatewaySMSProvider
@@ -9,19 +11,33 @@ logger = logging.getLogger(__name__)
 
 
 class SMSServiceFactory:
+    # Lowercase provider name → implementation, mirroring EmailServiceFactory.
+    # Add other providers here (SNS, MessageBird, etc.)
+    # Callable rather than type[SMSProvider]: the ABC defines no __init__,
+    # so the class-object form doesn't type-check the config argument.
+    _REGISTRY: dict[str, Callable[[SMSProviderConfig], SMSProvider]] = {
+        "twilio": TwilioSMSProvider,
+        "android_gateway": AndroidGatewaySMSProvider,
+    }
+
+    @classmethod
+    def register(cls, name: str, provider_cls: Callable[[SMSProviderConfig], SMSProvider]) -> None:
+        """Register an additional provider implementation under a lowercase name."""
+        cls._REGISTRY[name.lower()] = provider_cls
+
     @staticmethod
     def create(config: SMSProviderConfig) -> SMSProvider:
-        provider_type = str(config.provider_type).lower()
-
-        if provider_type == "twilio":
-            return TwilioSMSProvider(config)
+        return _build_provider(config)
 
-        if provider_type == "android_gateway":
-            return AndroidGatewaySMSProvider(config)
 
-        # Add other providers here (SNS, MessageBird, etc.)
+# Providers own connection state (the Twilio client keeps an HTTP pool), so
+# identical configs share one instance instead of re-opening TLS per send.
+# SMSProviderConfig is a frozen dataclass, which makes it a valid cache key.
+@lru_cache(maxsize=256)
+def _build_provider(config: SMSProviderConfig) -> SMSProvider:
+    provider_cls = SMSServiceFactory._REGISTRY.get(str(config.provider_type).lower())
+    if provider_cls is not None:
+        return provider_cls(config)
 
-        logger.warning(
-            f"Unknown SMS provider type: {config.provider_type}. Falling back to Console."
-        )
-        return ConsoleSMSProvider()
+    logger.warning(f"Unknown SMS provider type: {config.provider_type}. Falling back to Console.")
+    return ConsoleSMSProvider()
@@ -21,17 +21,25 @@ class TwilioSMSProvider(SMSProvider):
         if not self.account_sid or not self.auth_token:
             logger.warning("Twilio Account SID or Auth Token is not set.")
 
+        # One client per provider — the SDK sets up its HTTP session and auth
+        # config at construction, so rebuilding it per message wasted that
+        # work and threw away the connection pool every send.
+        if Client is not None and self.account_sid and self.auth_token:
+            self._client = Client(self.account_sid, self.auth_token)
+        else:
+            self._client = None
+
     async def send_sms(self, to_number: str, message: str) -> bool:
         if Client is None:
             logger.error("Twilio SDK is not installed. Cannot send SMS.")
             return False
 
-        if not self.account_sid or not self.auth_token:
+        if self._client is None:
             logger.error("Cannot send SMS: Twilio credentials missing.")
             return False
 
         try:
-            client = Client(self.account_sid, self.auth_token)
+            client = self._client
 
             # Determine if we use from_ (phone number) or messaging_service_sid
             send_args = {"body": message, "to": to_number}
@@ -40,9 +48,9 @@ class TwilioSMSProvider(SMSProvider):
             else:
                 send_args["from_"] = self.from_number
 
-            # Run the synchronous Twilio call in a thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, lambda: client.messages.create(**send_args))
+            # Run the synchronous Twilio call in a thread pool — kwargs pass
+            # straight through, no closure frame per send
+            await asyncio.to_thread(client.messages.create, **send_args)
 
             logger.info(f"SMS sent successfully to {to_number}")
             return True
@@ -1,4 +1,5 @@
 import logging
+import time
 import uuid
 
 from auth_engine.core.security import security
@@ -10,18 +11,45 @@ from auth_engine.services.tenant_config_resolver import resolve_config_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Same shape as the email resolver cache: provider instances are stateless
+# once built and resolvers are per-request, so memoize at module level keyed
+# by tenant. Steady-state resolve skips the DB read and the Fernet decrypt.
+_CACHE_TTL_SECONDS = 300.0
+_provider_cache: dict[uuid.UUID, tuple[SMSProvider, float]] = {}
+
+
+def invalidate_sms_provider_cache(tenant_id: uuid.UUID | None = None) -> None:
+    """Drop cached providers — one tenant's, or all of them when tenant_id is None.
+
+    Call this whenever a tenant's SMS config is changed or deleted.
+    """
+    if tenant_id is None:
+        _provider_cache.clear()
+    else:
+        _provider_cache.pop(tenant_id, None)
+
 
 class SMSServiceResolver:
     def __init__(self, repository: TenantSMSConfigRepository):
         self.repository = repository
 
     async def _provider_from_tenant(self, tenant_id: uuid.UUID) -> SMSProvider | None:
+        entry = _provider_cache.get(tenant_id)
+        if entry is not None and time.monotonic() - entry[1] < _CACHE_TTL_SECONDS:
+            return entry[0]
+
+        provider = await self._load_provider(tenant_id)
+        if provider is not None:
+            _provider_cache[tenant_id] = (provider, time.monotonic())
+        return provider
+
+    async def _load_provider(self, tenant_id: uuid.UUID) -> SMSProvider | None:
         tenant_config_orm = await self.repository.get_by_tenant_id(tenant_id)
         if not tenant_config_orm or not tenant_config_orm.is_active:
             return None
 
         try:
-            api_key = security.decrypt_data(tenant_config_orm.encrypted_credentials)
+            api_key = security.decrypt_config_data(tenant_config_orm.encrypted_credentials)
             config = SMSProviderConfig(
                 provider_type=tenant_config_orm.provider.value,
                 api_key=api_key,
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -6,16 +7,23 @@ from pathlib import Path
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DESCENDING, IndexModel
 
 from auth_engine.api.ui_router import ui_router
 from auth_engine.api.v1.oidc.discovery import well_known_router
 from auth_engine.api.v1.router import api_router
+from auth_engine.auth_strategies.oauth.http import aclose_shared_client
 from auth_engine.core import mongodb
 from auth_engine.core.config import settings
 from auth_engine.core.mongodb import close_mongo, init_mongo
-from auth_engine.core.postgres import check_db_connection
+from auth_engine.core.postgres import check_db_connection, warm_pool
 from auth_engine.core.redis import redis_client
+from auth_engine.external_services.email.providers.sendgrid import aclose_sendgrid_client
+from auth_engine.services.api_key_usage import start_usage_flusher, stop_usage_flusher
+from auth_engine.services.audit_service import start_audit_flusher, stop_audit_flusher
 
 logging.basicConfig(
     level=logging.DEBUG if settings.DEBUG else logging.INFO,
@@ -29,36 +37,84 @@ logging.getLogger("pymongo").setLevel(logging.WARNING)
 logging.getLogger("motor").setLevel(logging.WARNING)
 
 
+async def _init_postgres() -> None:
+    await check_db_connection()
+    await warm_pool()
+
+
+# background=True so index builds on already-populated collections don't
+# block startup holding the collection lock.
+_AUDIT_LOG_INDEXES = [
+    IndexModel("actor_id", background=True),
+    IndexModel("created_at", background=True),
+    # No single tenant_id index: it's a prefix of this compound one, so
+    # queries on tenant_id alone use it too.
+    IndexModel([("tenant_id", 1), ("created_at", DESCENDING)], background=True),
+]
+_CONTACT_LEAD_INDEXES = [
+    IndexModel("created_at", background=True),
+    IndexModel("email", background=True),
+]
+
+
+async def _ensure_indexes(collection: AsyncIOMotorCollection, models: list[IndexModel]) -> None:
+    """Create whichever of `models` don't exist yet, in one round-trip.
+
+    On a warm boot the index_information read is the only Mongo traffic.
+    """
+    existing = await collection.index_information()
+    missing = [model for model in models if model.document["name"] not in existing]
+    if missing:
+        await collection.create_indexes(missing)
+
+
+async def _claim_index_bootstrap() -> bool:
+    """First worker to set the flag runs the Mongo index bootstrap.
+
+    Falls back to True (run the bootstrap) if Redis isn't up — the
+    per-collection existence check keeps that path cheap anyway.
+    """
+    if redis_client.client is None:
+        return True
+    claimed = await redis_client.client.set("auth_engine:indexes_ready", "1", nx=True, ex=86400)
+    return bool(claimed)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting up AuthEngine...")
 
-    await check_db_connection()
-    logger.info("postgres up for AuthEngine...")
-    await init_mongo()
-    logger.info("mongo up for AuthEngine...")
-    await redis_client.connect()
-    logger.info("redis up for AuthEngine...")
+    # The three store bootstraps are independent I/O — run them concurrently
+    # so startup waits for the slowest one, not the sum of all three.
+    results = await asyncio.gather(
+        _init_postgres(), init_mongo(), redis_client.connect(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    logger.info("postgres, mongo, and redis up for AuthEngine...")
 
     # NOTE: Roles/permissions and the super admin are no longer seeded here.
     # Seeding lives in the separate `auth-engine-data` repo — run
     # `auth-engine-data all` after migrations when provisioning an environment.
 
-    # Initialize Audit Log Indexes
-    if mongodb.mongo_db is not None:
-        collection = mongodb.mongo_db["audit_logs"]
-        await collection.create_index("actor_id")
-        await collection.create_index("tenant_id")
-        await collection.create_index("created_at")
-        await collection.create_index([("tenant_id", 1), ("created_at", -1)])
+    # Initialize Audit Log Indexes. Under multiple workers only the first
+    # one to claim the Redis flag pays the Mongo round-trips; the flag
+    # expires daily so drift (dropped indexes) still self-heals.
+    if mongodb.mongo_db is not None and await _claim_index_bootstrap():
+        await _ensure_indexes(mongodb.mongo_db["audit_logs"], _AUDIT_LOG_INDEXES)
+        await _ensure_indexes(mongodb.mongo_db["contact_leads"], _CONTACT_LEAD_INDEXES)
 
-        leads = mongodb.mongo_db["contact_leads"]
-        await leads.create_index("created_at")
-        await leads.create_index("email")
+    start_audit_flusher()
+    start_usage_flusher()
 
     yield
 
     logger.info("Shutting down AuthEngine...")
+    await stop_usage_flusher()
+    await stop_audit_flusher()
+    await aclose_shared_client()
+    await aclose_sendgrid_client()
     await close_mongo()
     await redis_client.disconnect()
 
@@ -69,14 +125,22 @@ app = FastAPI(
     description=settings.APP_DESCRIPTION,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Frozen once at import — CORSMiddleware keeps references to these for the
+# lifetime of the app, so there's no point rebuilding lists per instantiation,
+# and tuples make accidental mutation impossible.
+_CORS_ORIGINS = tuple(settings.CORS_ORIGINS)
+_CORS_METHODS = ("*",)
+_CORS_HEADERS = ("*",)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
 )
 
 
@@ -1,17 +1,31 @@
-from .email_config import TenantEmailConfigORM
-from .oauth_account import OAuthAccountORM
-from .oidc_client import OIDCClientORM
-from .permission import PermissionORM
-from .role import RoleORM
-from .role_permission import RolePermissionORM
-from .service_api_key import ServiceApiKeyORM
-from .sms_config import TenantSMSConfigORM
-from .tenant import TenantORM
-from .tenant_auth_config import TenantAuthConfigORM
-from .tenant_social_provider import TenantSocialProviderORM
-from .user import UserORM
-from .user_role import UserRoleORM
-from .webauthn_credential import WebAuthnCredentialORM
+"""ORM model package.
+
+Models are imported lazily (PEP 562) so that importing the package doesn't
+pay for every module's SQLAlchemy class construction up front. Relationships
+reference classes by string name across modules, though, so the declarative
+registry must be complete before any mapper configures — the first attribute
+access therefore imports *all* model modules, not just the one asked for.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    "TenantEmailConfigORM": "auth_engine.models.email_config",
+    "OAuthAccountORM": "auth_engine.models.oauth_account",
+    "OIDCClientORM": "auth_engine.models.oidc_client",
+    "PermissionORM": "auth_engine.models.permission",
+    "RoleORM": "auth_engine.models.role",
+    "RolePermissionORM": "auth_engine.models.role_permission",
+    "ServiceApiKeyORM": "auth_engine.models.service_api_key",
+    "TenantSMSConfigORM": "auth_engine.models.sms_config",
+    "TenantORM": "auth_engine.models.tenant",
+    "TenantAuthConfigORM": "auth_engine.models.tenant_auth_config",
+    "TenantSocialProviderORM": "auth_engine.models.tenant_social_provider",
+    "UserORM": "auth_engine.models.user",
+    "UserRoleORM": "auth_engine.models.user_role",
+    "WebAuthnCredentialORM": "auth_engine.models.webauthn_credential",
+}
 
 __all__ = [
     "UserORM",
@@ -29,3 +43,13 @@ __all__ = [
     "OIDCClientORM",
     "WebAuthnCredentialORM",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Populate the whole registry in one go and cache every class in
+    # globals() so subsequent lookups bypass __getattr__ entirely.
+    for attr, module_path in _LAZY_IMPORTS.items():
+        globals()[attr] = getattr(importlib.import_module(module_path), attr)
+    return globals()[name]
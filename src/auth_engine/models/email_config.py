@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class EmailProviderType(str, Enum):
@@ -18,7 +19,7 @@ class EmailProviderType(str, Enum):
 class TenantEmailConfigORM(Base):
     __tablename__ = "tenant_email_configs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True
     )
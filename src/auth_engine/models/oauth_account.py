@@ -1,11 +1,12 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class OAuthAccountORM(Base):
@@ -19,7 +20,7 @@ class OAuthAccountORM(Base):
 
     __tablename__ = "oauth_accounts"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Which AuthEngine user this account belongs to
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -35,9 +36,11 @@ class OAuthAccountORM(Base):
     # The user's ID on the provider side (e.g. Google's "sub" claim)
     provider_user_id: Mapped[str] = mapped_column(String(255), nullable=False)
 
-    # Tokens from the provider (stored for potential API calls on behalf of user)
-    access_token: Mapped[str | None] = mapped_column(String(2048), nullable=True)
-    refresh_token: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+    # Tokens from the provider (stored for potential API calls on behalf of user).
+    # Text rather than a wide varchar: oversized tokens get TOASTed out of the
+    # heap page instead of bloating every row fetched during login.
+    access_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     token_expires_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -61,9 +64,12 @@ class OAuthAccountORM(Base):
     # Relationships
     user = relationship("UserORM", back_populates="oauth_accounts")
 
-    # A user cannot have two accounts from the same provider
+    # A user cannot have two accounts from the same provider.
+    # The composite (user_id, provider) index serves the list-accounts-for-user
+    # joins without a second heap fetch for the provider column.
     __table_args__ = (
         UniqueConstraint("provider", "provider_user_id", name="uq_oauth_provider_user"),
+        Index("ix_oauth_user_provider", "user_id", "provider"),
     )
 
     def __repr__(self) -> str:
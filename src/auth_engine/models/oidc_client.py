@@ -6,12 +6,13 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class OIDCClientORM(Base):
     __tablename__ = "oidc_clients"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     client_id: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     client_secret: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
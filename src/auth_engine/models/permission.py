@@ -5,13 +5,17 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class PermissionORM(Base):
     __tablename__ = "permissions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
 
-    roles = relationship("RolePermissionORM", back_populates="permission")
+    # No caller walks permission → roles today; raise_on_sql turns a future
+    # accidental lazy load (a per-permission N+1) into an immediate error.
+    # Intentional traversals should use selectinload(PermissionORM.roles).
+    roles = relationship("RolePermissionORM", back_populates="permission", lazy="raise_on_sql")
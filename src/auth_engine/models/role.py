@@ -1,14 +1,15 @@
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class RoleScope(str, Enum):
@@ -25,7 +26,7 @@ PLATFORM_SYSTEM_ROLE_NAMES = frozenset({"SUPER_ADMIN", "PLATFORM_ADMIN"})
 class RoleORM(Base):
     __tablename__ = "roles"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
     scope: Mapped[RoleScope] = mapped_column(SAEnum(RoleScope, name="rolescope"), nullable=False)
@@ -45,9 +46,7 @@ class RoleORM(Base):
         nullable=True,
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
-    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     permissions = relationship(
         "RolePermissionORM",
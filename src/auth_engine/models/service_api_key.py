@@ -18,17 +18,18 @@ Flow:
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class ServiceApiKeyORM(Base):
     __tablename__ = "service_api_keys"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Human-readable name of the service this key belongs to
     service_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -74,3 +75,13 @@ class ServiceApiKeyORM(Base):
     # Relationships
     tenant = relationship("TenantORM")
     creator = relationship("UserORM", foreign_keys=[created_by])
+
+    # Partial index for the introspect hot path: the lookup is always
+    # key_hash + is_active, and only active keys are in the index.
+    __table_args__ = (
+        Index(
+            "ix_service_api_keys_active_hash",
+            "key_hash",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_engine.core.postgres import Base
+from auth_engine.core.uuidv7 import uuid7
 
 
 class WebAuthnCredentialORM(Base):
@@ -19,7 +20,7 @@ class WebAuthnCredentialORM(Base):
 
     __tablename__ = "webauthn_credentials"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
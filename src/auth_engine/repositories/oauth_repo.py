@@ -1,7 +1,10 @@
 import uuid
+from collections import defaultdict
+from collections.abc import Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from auth_engine.models.oauth_account import OAuthAccountORM
 from auth_engine.repositories.postgres_repo import PostgresRepository
@@ -15,26 +18,53 @@ class OAuthAccountRepository(PostgresRepository[OAuthAccountORM]):
         self, provider: str, provider_user_id: str
     ) -> OAuthAccountORM | None:
         """Find an OAuth account by provider name + provider's user ID."""
-        query = select(self.model).where(
-            self.model.provider == provider,
-            self.model.provider_user_id == provider_user_id,
+        # raiseload: nothing should walk account.user lazily off this path
+        query = (
+            select(self.model)
+            .where(
+                self.model.provider == provider,
+                self.model.provider_user_id == provider_user_id,
+            )
+            .options(raiseload("*"))
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
     async def get_by_user_id(self, user_id: uuid.UUID) -> list[OAuthAccountORM]:
         """Get all OAuth accounts linked to a specific AuthEngine user."""
-        query = select(self.model).where(self.model.user_id == user_id)
+        query = select(self.model).where(self.model.user_id == user_id).options(raiseload("*"))
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_by_user_ids(
+        self, user_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, list[OAuthAccountORM]]:
+        """Get OAuth accounts for many users in one query.
+
+        Use this instead of calling get_by_user_id in a loop — one
+        WHERE user_id = ANY(...) round-trip regardless of batch size.
+        Users without linked accounts are absent from the result.
+        """
+        if not user_ids:
+            return {}
+        query = select(self.model).where(self.model.user_id.in_(user_ids)).options(raiseload("*"))
+        result = await self.session.execute(query)
+        grouped: dict[uuid.UUID, list[OAuthAccountORM]] = defaultdict(list)
+        for row in result.scalars():
+            grouped[row.user_id].append(row)
+        return dict(grouped)
+
     async def get_by_user_and_provider(
         self, user_id: uuid.UUID, provider: str
     ) -> OAuthAccountORM | None:
         """Check if a user already has a specific provider linked."""
-        query = select(self.model).where(
-            self.model.user_id == user_id,
-            self.model.provider == provider,
+        query = (
+            select(self.model)
+            .where(
+                self.model.user_id == user_id,
+                self.model.provider == provider,
+            )
+            .options(raiseload("*"))
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
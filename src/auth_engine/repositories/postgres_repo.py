@@ -36,6 +36,24 @@ class PostgresRepository(Generic[T]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def bulk_update(self, ids: Sequence[Any], values: dict[str, Any]) -> int:
+        """Apply the same values to many rows in one UPDATE.
+
+        Unlike update(), this neither RETURNs nor hydrates rows and skips the
+        session-synchronization pass — use it when callers only need the
+        affected-row count (timestamp touches, flag flips).
+        """
+        if not ids:
+            return 0
+        query = (
+            update(self.model)
+            .where(self.model.id.in_(ids))  # type: ignore[attr-defined]
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def delete(self, id: Any) -> bool:
         query = delete(self.model).where(self.model.id == id)  # type: ignore[attr-defined]
         result = await self.session.execute(query)
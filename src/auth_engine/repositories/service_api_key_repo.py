@@ -28,10 +28,6 @@ class ServiceApiKeyRepository(PostgresRepository[ServiceApiKeyORM]):
 
         return key
 
-    async def touch_last_used(self, key_id: uuid.UUID) -> None:
-        """Update last_used_at timestamp — called after every successful introspect."""
-        await self.update(key_id, {"last_used_at": datetime.now(UTC)})
-
     async def list_by_tenant(self, tenant_id: uuid.UUID) -> list[ServiceApiKeyORM]:
         query = select(self.model).where(self.model.tenant_id == tenant_id)
         result = await self.session.execute(query)
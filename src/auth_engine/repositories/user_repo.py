@@ -1,69 +1,67 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload, selectinload
 
 from auth_engine.models import RoleORM, RolePermissionORM, UserORM, UserRoleORM
 from auth_engine.repositories.postgres_repo import PostgresRepository
 
+# Built once at import: the four lookups share one eager-load tree and each
+# statement is a module-level constant, so per-call work is just binding the
+# parameter — no option-tree rebuild, and SQLAlchemy's compiled-SQL cache
+# hits on statement identity.
+#
+# selectinload instead of joinedload: the joined form returned a
+# roles x permissions cartesian product per user that .unique() then had to
+# collapse in Python; the IN-list queries ship only distinct rows.
+#
+# raiseload("*") turns any relationship access outside this tree (e.g.
+# user.webauthn_credentials) into an immediate error instead of a silent
+# per-row query; load those through their repositories.
+_LOAD_ROLE_TREE = (
+    selectinload(UserORM.roles)
+    .selectinload(UserRoleORM.role)
+    .selectinload(RoleORM.permissions)
+    .selectinload(RolePermissionORM.permission)
+)
+
+_GET_STMT = (
+    select(UserORM).where(UserORM.id == bindparam("id")).options(_LOAD_ROLE_TREE, raiseload("*"))
+)
+_BY_EMAIL_STMT = (
+    select(UserORM)
+    .where(UserORM.email == bindparam("email"))
+    .options(_LOAD_ROLE_TREE, raiseload("*"))
+)
+_BY_USERNAME_STMT = (
+    select(UserORM)
+    .where(UserORM.username == bindparam("username"))
+    .options(_LOAD_ROLE_TREE, raiseload("*"))
+)
+_BY_PHONE_STMT = (
+    select(UserORM)
+    .where(UserORM.phone_number == bindparam("phone_number"))
+    .options(_LOAD_ROLE_TREE, raiseload("*"))
+)
+
 
 class UserRepository(PostgresRepository[UserORM]):
     def __init__(self, session: AsyncSession):
         super().__init__(UserORM, session)
 
     async def get(self, id: uuid.UUID) -> UserORM | None:
-        query = (
-            select(self.model)
-            .where(self.model.id == id)
-            .options(
-                joinedload(UserORM.roles)
-                .joinedload(UserRoleORM.role)
-                .joinedload(RoleORM.permissions)
-                .joinedload(RolePermissionORM.permission)
-            )
-        )
-        result = await self.session.execute(query)
-        return result.unique().scalar_one_or_none()
+        result = await self.session.execute(_GET_STMT, {"id": id})
+        return result.scalar_one_or_none()
 
     async def get_by_email(self, email: str) -> UserORM | None:
-        query = (
-            select(self.model)
-            .where(self.model.email == email)
-            .options(
-                joinedload(UserORM.roles)
-                .joinedload(UserRoleORM.role)
-                .joinedload(RoleORM.permissions)
-                .joinedload(RolePermissionORM.permission)
-            )
-        )
-        result = await self.session.execute(query)
-        return result.unique().scalar_one_or_none()
+        result = await self.session.execute(_BY_EMAIL_STMT, {"email": email})
+        return result.scalar_one_or_none()
 
     async def get_by_username(self, username: str) -> UserORM | None:
-        query = (
-            select(self.model)
-            .where(self.model.username == username)
-            .options(
-                joinedload(UserORM.roles)
-                .joinedload(UserRoleORM.role)
-                .joinedload(RoleORM.permissions)
-                .joinedload(RolePermissionORM.permission)
-            )
-        )
-        result = await self.session.execute(query)
-        return result.unique().scalar_one_or_none()
+        result = await self.session.execute(_BY_USERNAME_STMT, {"username": username})
+        return result.scalar_one_or_none()
 
     async def get_by_phone_number(self, phone_number: str) -> UserORM | None:
-        query = (
-            select(self.model)
-            .where(self.model.phone_number == phone_number)
-            .options(
-                joinedload(UserORM.roles)
-                .joinedload(UserRoleORM.role)
-                .joinedload(RoleORM.permissions)
-                .joinedload(RolePermissionORM.permission)
-            )
-        )
-        result = await self.session.execute(query)
-        return result.unique().scalar_one_or_none()
+        result = await self.session.execute(_BY_PHONE_STMT, {"phone_number": phone_number})
+        return result.scalar_one_or_none()
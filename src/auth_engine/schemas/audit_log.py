@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AuditLogBase(BaseModel):
@@ -26,6 +26,6 @@ class AuditLog(AuditLogBase):
     id: str = Field(..., alias="_id")
     created_at: datetime
 
-    class Config:
-        populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    # No custom datetime encoder — pydantic v2 already serializes datetimes
+    # as ISO 8601 in its Rust core, without a per-value Python lambda call.
+    model_config = ConfigDict(populate_by_name=True)
@@ -5,7 +5,7 @@ Pydantic schemas for the Magic Link authentication endpoints.
 
 import uuid
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class MagicLinkRequest(BaseModel):
@@ -27,13 +27,14 @@ class MagicLinkRequest(BaseModel):
         ),
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "tenant_id": None,
             }
         }
+    )
 
 
 class MagicLinkRequestResponse(BaseModel):
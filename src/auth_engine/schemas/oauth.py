@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 OAuthProvider = Literal["google", "github", "microsoft", "authengine"]
 
@@ -43,8 +43,7 @@ class OAuthAccountResponse(BaseModel):
     provider_avatar_url: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OAuthAccountLinkResponse(BaseModel):
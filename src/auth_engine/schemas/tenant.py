@@ -4,6 +4,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 
+from .user import UserResponse
+
 
 class TenantType(str, Enum):
     PLATFORM = "PLATFORM"
@@ -61,3 +63,14 @@ class TenantInviteRequest(BaseModel):
     email: EmailStr
     role_name: str = "TENANT_USER"
     role_id: uuid.UUID | None = None
+
+
+class TenantUserListResponse(BaseModel):
+    """Keyset-paginated page of tenant users.
+
+    Pass ``next_cursor`` back as ``after`` to fetch the following page;
+    ``None`` means the last page was reached.
+    """
+
+    items: list[UserResponse]
+    next_cursor: uuid.UUID | None = None
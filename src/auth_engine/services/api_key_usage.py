@@ -0,0 +1,80 @@
+"""Write-behind buffering for service API key last_used_at touches.
+
+Every successful introspect used to run its own UPDATE. For a busy
+service key that's thousands of identical writes per second, all WAL
+pressure for a timestamp nobody reads in real time. record_key_usage()
+instead notes the latest timestamp in a process-local dict; a background
+task (same shape as the audit flusher) writes one UPDATE per key per
+flush interval.
+"""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import update
+
+from auth_engine.core.postgres import AsyncSessionLocal
+from auth_engine.models.service_api_key import ServiceApiKeyORM
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+_last_used_buffer: dict[uuid.UUID, datetime] = {}
+_flusher_task: asyncio.Task[None] | None = None
+
+
+def record_key_usage(key_id: uuid.UUID) -> None:
+    """Note that a key was just used. O(1), never touches the database."""
+    _last_used_buffer[key_id] = datetime.now(UTC)
+
+
+async def _flush_pending() -> None:
+    """Write out the buffered timestamps, one UPDATE per key."""
+    if not _last_used_buffer:
+        return
+    pending = dict(_last_used_buffer)
+    _last_used_buffer.clear()
+    try:
+        async with AsyncSessionLocal() as session:
+            for key_id, last_used in pending.items():
+                await session.execute(
+                    update(ServiceApiKeyORM)
+                    .where(ServiceApiKeyORM.id == key_id)
+                    .values(last_used_at=last_used)
+                    .execution_options(synchronize_session=False)
+                )
+            await session.commit()
+    except Exception:
+        # Best effort — put the timestamps back so the next flush retries,
+        # without clobbering anything recorded while we were writing.
+        for key_id, last_used in pending.items():
+            _last_used_buffer.setdefault(key_id, last_used)
+        logger.warning("Deferred last_used_at flush failed; will retry", exc_info=True)
+
+
+async def _usage_flusher() -> None:
+    while True:
+        await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+        await _flush_pending()
+
+
+def start_usage_flusher() -> None:
+    """Start the background flush task (called from the app lifespan)."""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_usage_flusher())
+
+
+async def stop_usage_flusher() -> None:
+    """Cancel the flush task and write out anything still buffered."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flusher_task
+        _flusher_task = None
+    await _flush_pending()
@@ -1,8 +1,72 @@
+import asyncio
+import contextlib
+import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+# Audit writes are best-effort and never need to block the request path.
+# log() enqueues the document; a single background task drains the queue
+# and batches concurrent writes into one insert_many round trip.
+_FLUSH_INTERVAL_SECONDS = 0.05
+_FLUSH_MAX_BATCH = 100
+_QUEUE_MAX_SIZE = 10_000
+
+_audit_queue: asyncio.Queue[tuple[AsyncIOMotorCollection, dict[str, Any]]] = asyncio.Queue(
+    maxsize=_QUEUE_MAX_SIZE
+)
+_flusher_task: asyncio.Task[None] | None = None
+
+
+async def _flush_pending() -> None:
+    """Drain whatever is queued right now and insert it in one batch per collection."""
+    batches: dict[str, tuple[AsyncIOMotorCollection, list[dict[str, Any]]]] = {}
+    while not _audit_queue.empty() and sum(len(b[1]) for b in batches.values()) < _FLUSH_MAX_BATCH:
+        try:
+            collection, document = _audit_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        key = str(collection.full_name)
+        if key not in batches:
+            batches[key] = (collection, [])
+        batches[key][1].append(document)
+
+    for collection, documents in batches.values():
+        try:
+            await collection.insert_many(documents, ordered=False)
+        except Exception:
+            # Non-blocking, best effort logging
+            pass
+
+
+async def _audit_flusher() -> None:
+    while True:
+        await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+        if not _audit_queue.empty():
+            await _flush_pending()
+
+
+def start_audit_flusher() -> None:
+    """Start the background audit flush task (called from the app lifespan)."""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_audit_flusher())
+
+
+async def stop_audit_flusher() -> None:
+    """Cancel the flush task and write out anything still queued."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flusher_task
+        _flusher_task = None
+    while not _audit_queue.empty():
+        await _flush_pending()
 
 
 class AuditService:
@@ -23,22 +87,22 @@ class AuditService:
         user_agent: str | None = None,
         status: str = "success",
     ) -> None:
+        document = {
+            "_id": str(uuid.uuid4()),
+            "actor_id": str(actor_id) if actor_id else None,
+            "target_user_id": str(target_user_id) if target_user_id else None,
+            "tenant_id": str(tenant_id) if tenant_id else None,
+            "action": action,
+            "resource": resource,
+            "resource_id": resource_id,
+            "status": status,
+            "metadata": metadata or {},
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "created_at": datetime.utcnow(),
+        }
         try:
-            document = {
-                "_id": str(uuid.uuid4()),
-                "actor_id": str(actor_id) if actor_id else None,
-                "target_user_id": str(target_user_id) if target_user_id else None,
-                "tenant_id": str(tenant_id) if tenant_id else None,
-                "action": action,
-                "resource": resource,
-                "resource_id": resource_id,
-                "status": status,
-                "metadata": metadata or {},
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-                "created_at": datetime.utcnow(),
-            }
-            await self.collection.insert_one(document)
-        except Exception:
+            _audit_queue.put_nowait((self.collection, document))
+        except asyncio.QueueFull:
             # Non-blocking, best effort logging
             pass
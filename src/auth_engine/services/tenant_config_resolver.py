@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
 import uuid
+from functools import lru_cache
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +13,27 @@ from auth_engine.services.social_provider_service import get_canonical_platform_
 
 logger = logging.getLogger(__name__)
 
+# Canonical hyphenated form, which is what every internal caller passes.
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> uuid.UUID | None:
+    """Parse a tenant id string, avoiding ValueError construction on the hot path.
+
+    The regex pre-screen keeps canonical ids (the common case) exception-free;
+    non-canonical but valid forms still go through uuid.UUID, and each
+    malformed string pays the exception cost at most once thanks to the cache.
+    """
+    if _UUID_RE.match(value):
+        return uuid.UUID(value)
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
+
 
 async def resolve_config_tenant_id(
     session: AsyncSession,
@@ -20,14 +43,12 @@ async def resolve_config_tenant_id(
     if tenant_id is None or tenant_id == "default":
         return await get_canonical_platform_tenant_id(session)
 
-    resolved: uuid.UUID | None
-    if isinstance(tenant_id, str):
-        try:
-            resolved = uuid.UUID(tenant_id)
-        except ValueError:
-            logger.warning("Invalid tenant_id format: %s", tenant_id)
-            return await get_canonical_platform_tenant_id(session)
-    else:
-        resolved = tenant_id
+    if not isinstance(tenant_id, str):
+        return tenant_id
+
+    resolved = _parse_uuid(tenant_id)
+    if resolved is None:
+        logger.warning("Invalid tenant_id format: %s", tenant_id)
+        return await get_canonical_platform_tenant_id(session)
 
     return resolved
@@ -2,7 +2,7 @@ import logging
 import uuid
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import joinedload
 
 from auth_engine.core.config import settings
@@ -16,6 +16,20 @@ from auth_engine.services.role_service import RoleService
 logger = logging.getLogger(__name__)
 
 
+# Built once at import so SQLAlchemy's compiled-statement cache is keyed on a
+# stable statement object (per-call construction of the joinedload options can
+# miss the cache and re-compile the SQL on every request).
+_GET_TENANT_USER_STMT = (
+    select(UserORM)
+    .join(UserRoleORM, UserRoleORM.user_id == UserORM.id)
+    .where(
+        UserORM.id == bindparam("user_id"),
+        UserRoleORM.tenant_id == bindparam("tenant_id"),
+    )
+    .options(joinedload(UserORM.roles).joinedload(UserRoleORM.role))
+)
+
+
 def _coerce_tenant_type(value: str | TenantType) -> TenantType:
     if isinstance(value, TenantType):
         return value
@@ -252,18 +266,38 @@ class TenantService:
                 )
         return True
 
-    async def list_tenant_users(self, tenant_id: uuid.UUID, actor: UserORM) -> list[UserORM]:
+    async def list_tenant_users(
+        self,
+        tenant_id: uuid.UUID,
+        actor: UserORM,
+        limit: int = 100,
+        after: uuid.UUID | None = None,
+    ) -> list[UserORM]:
+        """List tenant users with keyset pagination.
+
+        Orders by user id and returns at most ``limit`` rows starting after
+        the ``after`` cursor, so memory and DB scan stay bounded regardless
+        of tenant size.
+        """
         if not await PermissionService.has_permission(
             self.user_repo.session, actor, "tenant.users.view", tenant_id
         ):
             raise ValueError("Insufficient permissions: Missing 'tenant.users.view'")
 
+        # distinct() before the limit: a user with several roles in the tenant
+        # produces one joined row per role, and without dedup those duplicates
+        # consume limit slots — pages come back short and the caller stops
+        # paginating early.
         query = (
             select(UserORM)
             .join(UserRoleORM, UserRoleORM.user_id == UserORM.id)
             .where(UserRoleORM.tenant_id == tenant_id)
+            .distinct()
             .options(joinedload(UserORM.roles).joinedload(UserRoleORM.role))
         )
+        if after is not None:
+            query = query.where(UserORM.id > after)
+        query = query.order_by(UserORM.id).limit(limit)
         result = await self.user_repo.session.execute(query)
         return list(result.unique().scalars().all())
 
@@ -377,7 +411,7 @@ class TenantService:
                 """
                 await email_service.send_email([email], subject, html_content)
             except Exception as e:
-                logger.error(f"Failed to send invitation email to {email}: {e}")
+                logger.error("Failed to send invitation email to %s: %s", email, e)
 
             action_desc = f"added to {tenant.name} with role {assigned_role}"
 
@@ -430,7 +464,7 @@ class TenantService:
                 """
                 await email_service.send_email([email], subject, html_content)
             except Exception as e:
-                logger.error(f"Failed to send invitation email to {email}: {e}")
+                logger.error("Failed to send invitation email to %s: %s", email, e)
 
             action_desc = f"invited to {tenant.name} (account created) with role {assigned_role}"
 
@@ -471,15 +505,8 @@ class TenantService:
         ):
             raise ValueError("Insufficient permissions: Missing 'tenant.users.view'")
 
-        query = (
-            select(UserORM)
-            .join(UserRoleORM, UserRoleORM.user_id == UserORM.id)
-            .where(
-                UserORM.id == user_id,
-                UserRoleORM.tenant_id == tenant_id,
-            )
-            .options(joinedload(UserORM.roles).joinedload(UserRoleORM.role))
+        result = await self.user_repo.session.execute(
+            _GET_TENANT_USER_STMT,
+            {"user_id": user_id, "tenant_id": tenant_id},
         )
-
-        result = await self.user_repo.session.execute(query)
         return result.unique().scalar_one_or_none()